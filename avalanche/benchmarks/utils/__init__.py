@@ -3,6 +3,7 @@ from .collate_functions import *
 from .classification_dataset import *
 from .detection_dataset import *
 from .datasets_from_filelists import *
+from .prefetch import *
 from .torchvision_wrapper import *
 from .data import *
 from .transform_groups import *
@@ -24,12 +24,30 @@ from typing import (
     Union,
 )
 
+import numpy as np
+import torch
 import torch.utils.data as data
 
 from PIL import Image
+import io
+import mmap
 import os
 import os.path
+import tempfile
 import dill
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None  # type: ignore
+
+try:
+    from torchvision.io import read_file, decode_image, ImageReadMode
+
+    _torchvision_io_available = True
+except ImportError:
+    _torchvision_io_available = False
 
 from torch import Tensor
 from torchvision.transforms.functional import crop
@@ -50,20 +68,183 @@ def default_image_loader(path):
     return Image.open(path).convert("RGB")
 
 
-def default_flist_reader(flist: Union[str, Path]) -> List[Tuple[str, int]]:
+def fast_image_loader(path):
+    """
+    Image loader based on ``torchvision.io``.
+
+    Images are decoded through libjpeg-turbo/libpng and returned as uint8
+    tensors of shape (3, H, W) in RGB, skipping the PIL image object
+    entirely. On JPEG-heavy datasets this is typically several times
+    faster than the default PIL loader.
+
+    This loader is opt-in (pass it as the ``loader`` argument of
+    :class:`PathsDataset` or :class:`FilelistDataset`) because downstream
+    transforms must accept tensor input, as the ones in
+    ``torchvision.transforms.v2`` do. When ``torchvision.io`` is not
+    available, it falls back to the default PIL loader.
+
+    :param path: relative or absolute path of the file to load.
+
+    :returns: Returns the image as a (3, H, W) uint8 RGB tensor (or as a
+        RGB PIL image when falling back).
+    """
+    if not _torchvision_io_available:
+        return default_image_loader(path)
+    return decode_image(read_file(str(path)), mode=ImageReadMode.RGB)
+
+
+def default_blob_image_loader(buf: bytes):
+    """
+    Default loader for images stored in a packed blob.
+
+    :param buf: the encoded image bytes.
+
+    :returns: Returns the image as a RGB PIL image.
+    """
+    return Image.open(io.BytesIO(buf)).convert("RGB")
+
+
+# Filelists smaller than this are parsed in a single pass: below this
+# size the thread/chunking overhead dominates any parallel speedup.
+_PARALLEL_FLIST_MIN_BYTES = 32 * 1024 * 1024
+
+
+def _parse_flist_buffer(buf) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses a whitespace-separated path/label buffer with pandas.
+
+    :param buf: a bytes-like object or a path accepted by
+        ``pandas.read_csv``.
+
+    :returns: a ``(paths, labels)`` pair of arrays.
+    """
+
+    if isinstance(buf, bytes):
+        buf = io.BytesIO(buf)
+    try:
+        frame = pd.read_csv(
+            buf,
+            sep=r"\s+",
+            header=None,
+            usecols=[0, 1],
+            dtype={0: str, 1: np.int64},
+            # Paths are opaque strings: a file literally named "nan" or
+            # "null" must not become a float NaN. Disabling the NA scan
+            # also speeds up the tokenizer.
+            keep_default_na=False,
+            na_filter=False,
+        )
+    except pd.errors.EmptyDataError:
+        return np.empty((0,), dtype=object), np.empty((0,), dtype=np.int64)
+
+    return frame[0].to_numpy(dtype=object), frame[1].to_numpy()
+
+
+def _read_flist_arrays_parallel(
+    flist: Union[str, Path]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses a very large filelist by splitting it into newline-aligned
+    chunks, parsed concurrently by a thread pool.
+
+    The pandas tokenizer releases the GIL while parsing, so the chunks are
+    processed truly in parallel and the speedup is near-linear with the
+    number of cores.
+
+    :param flist: path of the filelist to read.
+
+    :returns: a ``(paths, labels)`` pair of arrays.
+    """
+
+    n_chunks = min(8, os.cpu_count() or 1)
+    with open(flist, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Chunk boundaries are aligned on the first newline at or
+            # after each even split point.
+            approx_size = len(mapped) // n_chunks
+            bounds = [0]
+            for chunk_idx in range(1, n_chunks):
+                newline_pos = mapped.find(b"\n", chunk_idx * approx_size)
+                if newline_pos == -1:
+                    break
+                if newline_pos + 1 > bounds[-1]:
+                    bounds.append(newline_pos + 1)
+            if bounds[-1] < len(mapped):
+                bounds.append(len(mapped))
+
+            chunks = [mapped[start:end] for start, end in zip(bounds, bounds[1:])]
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                parts = list(pool.map(_parse_flist_buffer, chunks))
+        finally:
+            mapped.close()
+
+    return (
+        np.concatenate([paths for paths, _ in parts]),
+        np.concatenate([labels for _, labels in parts]),
+    )
+
+
+def _read_flist_arrays(
+    flist: Union[str, Path]
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Parses a Caffe-style filelist using the C-implemented pandas tokenizer.
+
+    This avoids the per-line ``strip``/``split``/``int`` Python loop, which
+    is the bottleneck when reading filelists with millions of entries.
+    Very large filelists are additionally split into newline-aligned
+    chunks parsed in parallel.
+
+    :param flist: path of the filelist to read.
+
+    :returns: a ``(paths, labels)`` pair of arrays (an object array of str
+        and an int64 array), or None if pandas is not installed.
+    """
+
+    if pd is None:
+        return None
+
+    try:
+        flist_size = os.path.getsize(flist)
+    except OSError:
+        flist_size = 0
+    if flist_size >= _PARALLEL_FLIST_MIN_BYTES:
+        return _read_flist_arrays_parallel(flist)
+
+    return _parse_flist_buffer(flist)
+
+
+def default_flist_reader(
+    flist: Union[str, Path], fast: bool = True
+) -> List[Tuple[str, int]]:
     """
     This reader reads a filelist and return a list of paths.
 
     :param flist: path of the flislist to read. The flist format should be:
         impath label, impath label,  ...(same to caffe's filelist)
+    :param fast: if True (the default), parse the filelist with a
+        C-implemented bulk tokenizer instead of a Python-level loop over
+        lines. On large filelists this is usually more than an order of
+        magnitude faster. The line-by-line path is kept as a fallback and
+        is automatically used when pandas is not installed.
 
     :returns: Returns a list of paths (the examples to be loaded).
     """
 
+    if fast:
+        arrays = _read_flist_arrays(flist)
+        if arrays is not None:
+            paths, labels = arrays
+            return list(zip(paths.tolist(), labels.tolist()))
+
     imlist = []
-    with open(flist, "r") as rf:
-        for line in rf.readlines():
-            impath, imlabel = line.strip().split()
+    # Iterate the file object directly (with a large buffer) instead of
+    # materializing every line upfront via readlines(): parsing streams
+    # through the file with about half the peak memory.
+    with open(flist, "r", buffering=1 << 20) as rf:
+        for line in rf:
+            impath, imlabel = line.split()
             imlist.append((impath, int(imlabel)))
 
     return imlist
@@ -80,6 +261,210 @@ FilesDefT = Union[
 ]
 
 
+def _files_definition_to_arrays(files):
+    """
+    Converts a files definition to its structure-of-arrays form.
+
+    :param files: either a list of (path, target[, bbox]) tuples or an
+        already-built (paths, targets) pair of arrays.
+
+    :returns: a (paths, targets, bboxes) tuple, where paths is an object
+        array, targets is an int64 array (or a plain list when targets are
+        not integers) and bboxes is None when no bounding box was defined.
+    """
+
+    if (
+        isinstance(files, tuple)
+        and len(files) == 2
+        and isinstance(files[0], np.ndarray)
+    ):
+        paths, targets = files
+        if paths.dtype != object:
+            paths = paths.astype(object)
+        return paths, targets, None
+
+    if len(files) == 0:
+        return (
+            np.empty((0,), dtype=object),
+            np.empty((0,), dtype=np.int64),
+            None,
+        )
+
+    # Uniform definitions (all tuples of the same arity, which is the
+    # common case) are unpacked with a single C-level conversion to a 2D
+    # object array instead of a Python-level loop over the tuples.
+    try:
+        files_arr = np.asarray(files, dtype=object)
+    except ValueError:
+        # Ragged definitions: only some tuples carry a bounding box.
+        files_arr = None
+
+    bboxes: Optional[List]
+    if files_arr is not None and files_arr.ndim == 2:
+        paths = np.ascontiguousarray(files_arr[:, 0])
+        targets_list = files_arr[:, 1].tolist()
+        bboxes = files_arr[:, 2].tolist() if files_arr.shape[1] > 2 else None
+    else:
+        paths = np.empty(len(files), dtype=object)
+        targets_list = []
+        bboxes = None
+        for idx, file_def in enumerate(files):
+            paths[idx] = file_def[0]
+            targets_list.append(file_def[1])
+            if len(file_def) > 2:
+                if bboxes is None:
+                    bboxes = [None] * len(files)
+                bboxes[idx] = file_def[2]
+
+    targets: Union[np.ndarray, List]
+    try:
+        targets_arr = np.asarray(targets_list)
+    except (ValueError, TypeError):
+        targets_arr = None
+    if targets_arr is not None and targets_arr.dtype.kind in "iu":
+        targets = targets_arr.astype(np.int64, copy=False)
+    else:
+        # Non-integer targets: keep them as-is.
+        targets = targets_list
+
+    return paths, targets, bboxes
+
+
+def _intern_path_dirs(
+    paths: np.ndarray,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Splits each path into a (directory, filename) pair, deduplicating the
+    directory prefixes through a small lookup table.
+
+    Most datasets store many files in a few directories (one per class,
+    usually), so keeping the full path per entry duplicates the same
+    directory prefix over and over. For ImageNet-scale filelists this
+    interning cuts the path-table memory by an order of magnitude.
+
+    :param paths: object array of paths.
+
+    :returns: a (dirs, dir_ids, names) tuple: the unique directory table,
+        the per-entry int32 index into it and the per-entry filenames.
+    """
+
+    if len(paths) == 0:
+        return [], np.empty((0,), dtype=np.int32), paths
+
+    dirs = np.empty(len(paths), dtype=object)
+    names = np.empty(len(paths), dtype=object)
+    for idx, path in enumerate(paths):
+        dirs[idx], names[idx] = os.path.split(path)
+
+    uniq, inv = np.unique(dirs, return_inverse=True)
+    return uniq.tolist(), inv.astype(np.int32), names
+
+
+def _paths_datasets_with_shared_arrays(exp_lists) -> List["PathsDataset"]:
+    """
+    Builds one :class:`PathsDataset` per experience, all backed by slices
+    of a single pair of concatenated (paths, labels) arrays.
+
+    With many short experiences (a common continual-learning layout),
+    this stores the labels in one contiguous int64 buffer - each dataset
+    holds a view into it - instead of one separate small array per
+    experience. Definitions carrying bounding boxes or non-integer labels
+    fall back to the plain per-experience construction.
+
+    :param exp_lists: a list of experience definitions, each one a list
+        of (path, label[, bbox]) tuples.
+
+    :returns: one dataset per experience definition.
+    """
+
+    converted = [_files_definition_to_arrays(exp_list) for exp_list in exp_lists]
+    shareable = len(converted) > 0 and all(
+        exp_bboxes is None and isinstance(exp_targets, np.ndarray)
+        for _, exp_targets, exp_bboxes in converted
+    )
+    if not shareable:
+        return [PathsDataset(None, exp_list) for exp_list in exp_lists]
+
+    all_paths = np.concatenate([exp_paths for exp_paths, _, _ in converted])
+    all_targets = np.concatenate([exp_targets for _, exp_targets, _ in converted])
+    offsets = np.cumsum([0] + [len(exp_paths) for exp_paths, _, _ in converted])
+
+    return [
+        PathsDataset(
+            None,
+            (
+                all_paths[offsets[exp_idx] : offsets[exp_idx + 1]],
+                all_targets[offsets[exp_idx] : offsets[exp_idx + 1]],
+            ),
+        )
+        for exp_idx in range(len(converted))
+    ]
+
+
+def _detect_common_root(exp_lists) -> Optional[str]:
+    """
+    Detects the common filesystem root of all the paths in the given
+    experience lists.
+
+    A candidate root is first computed from the first and last path of each
+    list only and then validated against all paths with a short-circuiting
+    prefix check. Only when the validation fails (paths of a single list
+    spread over unrelated directories), the exact - and much slower -
+    computation over all the paths is used as a fallback. This keeps the
+    detection O(1) in the typical filelist layout, where each list shares
+    a few directory roots.
+
+    :param exp_lists: a list of experience definitions, each one a list of
+        (path, ...) tuples.
+
+    :returns: the common root, or None if no usable common root exists.
+        When a root is returned, every path is guaranteed to start with
+        the root followed by a path separator, so that the root can be
+        stripped by plain slicing.
+    """
+
+    non_empty = [exp_list for exp_list in exp_lists if len(exp_list) > 0]
+    if len(non_empty) == 0:
+        return None
+
+    def _validated(root) -> Optional[str]:
+        if root is None or len(root) == 0 or root == "/":
+            return None
+        prefix = os.fspath(root) + os.sep
+        if all(
+            os.fspath(x[0]).startswith(prefix)
+            for exp_list in non_empty
+            for x in exp_list
+        ):
+            return os.fspath(root)
+        return None
+
+    try:
+        candidate = os.path.commonpath(
+            [os.path.dirname(os.fspath(exp_list[0][0])) for exp_list in non_empty]
+            + [os.path.dirname(os.fspath(exp_list[-1][0])) for exp_list in non_empty]
+        )
+    except ValueError:
+        # commonpath may throw a ValueError in different situations!
+        # See the official documentation for more details
+        return None
+
+    result = _validated(candidate)
+    if result is not None:
+        return result
+
+    # The sampled candidate does not cover all paths: fall back to the
+    # exact computation.
+    try:
+        exact = os.path.commonpath(
+            [os.fspath(x[0]) for exp_list in non_empty for x in exp_list]
+        )
+    except ValueError:
+        return None
+
+    return _validated(exact)
+
+
 class PathsDataset(data.Dataset[Tuple[T, TTargetsType]], Generic[T, TTargetsType]):
     """
     This class extends the basic Pytorch Dataset class to handle list of paths
@@ -89,10 +474,14 @@ class PathsDataset(data.Dataset[Tuple[T, TTargetsType]], Generic[T, TTargetsType
     def __init__(
         self,
         root: Optional[PathALikeT],
-        files: Sequence[FilesDefT[TTargetsType]],
+        files: Union[Sequence[FilesDefT[TTargetsType]], Tuple[np.ndarray, np.ndarray]],
         transform: XTransform = None,
         target_transform: YTransform = None,
         loader: Callable[[str], T] = default_image_loader,
+        cache_mode: Optional[str] = None,
+        cache_image_size: Optional[Tuple[int, int]] = None,
+        return_tensor: bool = False,
+        readahead: int = 0,
     ):
         """
         Creates a File Dataset from a list of files and labels.
@@ -101,19 +490,349 @@ class PathsDataset(data.Dataset[Tuple[T, TTargetsType]], Generic[T, TTargetsType
         :param files: list of tuples. Each tuple must contain two elements: the
             full path to the pattern and its class label. Optionally, the tuple
             may contain a third element describing the bounding box to use for
-            cropping (top, left, height, width).
+            cropping (top, left, height, width). Alternatively, an
+            already-built (paths, labels) pair of NumPy arrays can be passed,
+            which is used as-is without materializing any tuple.
         :param transform: eventual transformation to add to the input data (x)
         :param target_transform: eventual transformation to add to the targets
             (y)
         :param loader: loader function to use (for the real data) given path.
+        :param cache_mode: if not None, decoded images are cached as uint8
+            arrays so that epochs after the first one skip the file read
+            and the decode entirely. With "memory" the cache is a plain
+            in-process array (each DataLoader worker fills its own copy);
+            with "mmap" it is backed by a memory-mapped temporary file,
+            which is shared across workers of the same dataset. Requires
+            all the (possibly bbox-cropped) images to have the same size.
+            Defaults to None, which disables the cache.
+        :param cache_image_size: the (height, width) of the decoded images.
+            Required (and only used) when ``cache_mode`` is set.
+        :param return_tensor: if True, cached entries are returned as
+            (3, H, W) uint8 tensors instead of being converted back to PIL
+            images, skipping one PIL object allocation and copy per
+            sample. Downstream transforms must then accept tensor input
+            (the ones in ``torchvision.transforms.v2`` do). Only valid
+            when ``cache_mode`` is set, and required when the loader
+            itself returns tensors (e.g. :func:`fast_image_loader`).
+            Defaults to False.
+        :param readahead: if greater than zero, each access pre-reads the
+            file of the sample this many positions ahead on a background
+            thread, so that the OS page cache is warm by the time that
+            sample is decoded. This hides file-read latency behind the
+            decode of the current sample, which helps on networked
+            filesystems and cold storage. Defaults to 0 (disabled).
         """
 
         self.root: Optional[Path] = Path(root) if root is not None else None
-        self.imgs = files
-        self.targets = [img_data[1] for img_data in self.imgs]
-        self.transform = transform
-        self.target_transform = target_transform
+        # Paths, targets and (optional) bounding boxes are kept in
+        # structure-of-arrays form: this is far more compact than a list of
+        # tuples and avoids a second pass to extract the targets. Paths are
+        # further split into an interned directory table plus per-entry
+        # filenames, which removes the duplicated directory prefixes.
+        paths, targets, bboxes = _files_definition_to_arrays(files)
+        dirs, dir_ids, names = _intern_path_dirs(paths)
+        self._dirs: List[str] = dirs
+        self._dir_ids: np.ndarray = dir_ids
+        self._names: np.ndarray = names
+        self._bboxes = bboxes
+        if isinstance(targets, np.ndarray):
+            # One contiguous int64 tensor: downstream samplers and
+            # class-balancing strategies can run bincount/where on it at C
+            # speed instead of iterating a Python list of boxed ints.
+            # Read-only arrays (as produced by pandas' to_numpy) must be
+            # copied: from_numpy would otherwise warn and alias immutable
+            # memory.
+            if not targets.flags.writeable:
+                targets = targets.copy()
+            targets = torch.from_numpy(np.ascontiguousarray(targets))
+        self.targets = targets
+        # The root is joined once per unique directory instead of once per
+        # sample in __getitem__. Note: changing root (or the content of
+        # files) after construction has no effect.
+        if self.root is None:
+            self._full_dirs: List[str] = dirs
+        else:
+            self._full_dirs = [
+                str(self.root / dir_path) if dir_path else str(self.root)
+                for dir_path in dirs
+            ]
+        # Mechanical partial evaluation of os.path.join: filenames never
+        # start with a separator, so joining reduces to "dir + sep + name"
+        # with the separator appended to each (unique) directory upfront.
+        # An empty directory contributes no prefix at all.
+        self._dir_prefixes: List[str] = [
+            (
+                (full_dir if full_dir.endswith(os.sep) else full_dir + os.sep)
+                if full_dir
+                else ""
+            )
+            for full_dir in self._full_dirs
+        ]
+
+        self.cache_mode = cache_mode
+        self._cache: Optional[np.ndarray] = None
+        self._cache_valid: Optional[np.ndarray] = None
+        self._cache_files: Optional[Tuple[str, str]] = None
+        self._cache_creator_pid: Optional[int] = None
+        if cache_mode is not None:
+            if cache_mode not in ("memory", "mmap"):
+                raise ValueError(
+                    'cache_mode must be None, "memory" or "mmap", got '
+                    + repr(cache_mode)
+                )
+            if cache_image_size is None:
+                raise ValueError(
+                    "cache_image_size (height, width) is required when "
+                    "the decoded-image cache is enabled."
+                )
+            self._cache_shape = (
+                len(self._names),
+                cache_image_size[0],
+                cache_image_size[1],
+                3,
+            )
+            self._init_cache()
+        if return_tensor and cache_mode is None:
+            raise ValueError(
+                "return_tensor=True requires the decoded-image cache "
+                "(cache_mode) to be enabled."
+            )
+        self.return_tensor = return_tensor
+        self.readahead = readahead
+        # The read-ahead worker is created lazily on first access, so the
+        # dataset can be forked/pickled to DataLoader workers before any
+        # thread exists.
+        self._readahead_pool: Optional[ThreadPoolExecutor] = None
+        self._readahead_pid: Optional[int] = None
+        self._readahead_pending = 0
+        self._transform = transform
+        self._target_transform = target_transform
         self.loader = loader
+        # __getitem__ runs millions of times on hot datasets: the
+        # implementation is picked once here instead of re-checking the
+        # same constant conditions on every single access.
+        self._select_getitem_impl()
+
+    @property
+    def transform(self) -> XTransform:
+        return self._transform
+
+    @transform.setter
+    def transform(self, value: XTransform):
+        self._transform = value
+        self._select_getitem_impl()
+
+    @property
+    def target_transform(self) -> YTransform:
+        return self._target_transform
+
+    @target_transform.setter
+    def target_transform(self, value: YTransform):
+        self._target_transform = value
+        self._select_getitem_impl()
+
+    def _select_getitem_impl(self) -> None:
+        """
+        Binds the __getitem__ implementation matching the current dataset
+        configuration.
+        """
+
+        # getattr defaults keep this safe when a subclass assigns the
+        # transforms before PathsDataset.__init__ has run.
+        if (
+            getattr(self, "_transform", None) is None
+            and getattr(self, "_target_transform", None) is None
+            and getattr(self, "_bboxes", None) is None
+            and getattr(self, "cache_mode", None) is None
+            and not getattr(self, "readahead", 0)
+        ):
+            self._getitem_impl = self._getitem_simple
+        else:
+            self._getitem_impl = self._getitem_general
+
+    def _make_path(self, index: int) -> str:
+        """
+        Rebuilds the (root-relative) path of the pattern at the given index.
+        """
+
+        return os.path.join(self._dirs[self._dir_ids[index]], self._names[index])
+
+    def _init_cache(self):
+        """
+        Allocates (or re-attaches to) the decoded-image cache buffers.
+        """
+
+        shape = self._cache_shape
+        if self.cache_mode == "memory":
+            self._cache = np.zeros(shape, dtype=np.uint8)
+            self._cache_valid = np.zeros(shape[0], dtype=np.uint8)
+            return
+
+        if self._cache_files is None:
+            data_fd, data_path = tempfile.mkstemp(suffix="-avl-img-cache.bin")
+            os.close(data_fd)
+            valid_fd, valid_path = tempfile.mkstemp(suffix="-avl-img-cache-valid.bin")
+            os.close(valid_fd)
+            self._cache_files = (data_path, valid_path)
+            self._cache_creator_pid = os.getpid()
+            mode = "w+"
+        else:
+            # Re-attach to the files created by the main process (happens
+            # in spawned DataLoader workers, after unpickling).
+            mode = "r+"
+        self._cache = np.memmap(
+            self._cache_files[0], dtype=np.uint8, mode=mode, shape=shape
+        )
+        self._cache_valid = np.memmap(
+            self._cache_files[1], dtype=np.uint8, mode=mode, shape=(shape[0],)
+        )
+
+    def _warm_file(self, path: str) -> None:
+        """
+        Reads the given file (discarding the content) to pull it into the
+        OS page cache. Runs on the read-ahead thread.
+        """
+
+        try:
+            with open(path, "rb") as f:
+                while f.read(1 << 20):
+                    pass
+        except OSError:
+            pass
+        finally:
+            self._readahead_pending -= 1
+
+    def _submit_readahead(self, index: int) -> None:
+        """
+        Schedules the warm-up read of the sample ``readahead`` positions
+        after the given one.
+        """
+
+        next_index = index + self.readahead
+        if next_index >= len(self._names):
+            return
+        if self._readahead_pool is not None and self._readahead_pid != os.getpid():
+            # A pool inherited through fork has no worker thread in this
+            # process, so its queue (and the pending counter) would only
+            # ever grow: drop it and start over.
+            self._readahead_pool = None
+            self._readahead_pending = 0
+        if self._readahead_pending >= self.readahead:
+            # Keep the queue bounded: better to skip a warm-up than to
+            # pile up work the consumer is not keeping pace with.
+            return
+        if self._readahead_pool is None:
+            self._readahead_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="PathsDataset-readahead"
+            )
+            self._readahead_pid = os.getpid()
+        self._readahead_pending += 1
+        self._readahead_pool.submit(
+            self._warm_file,
+            self._dir_prefixes[self._dir_ids[next_index]] + self._names[next_index],
+        )
+
+    def _cache_tensor(self, index: int) -> Tensor:
+        """
+        Builds a (3, H, W) uint8 tensor from the cached entry at the given
+        index. The data is copied, so downstream in-place transforms
+        cannot corrupt the cache.
+        """
+
+        arr = np.asarray(self._cache[index])
+        return torch.from_numpy(arr).permute(2, 0, 1).contiguous()
+
+    def _cache_store(self, index: int, img) -> None:
+        """
+        Stores the given decoded (and possibly cropped) image in the cache.
+
+        Accepts both PIL images and (3, H, W) uint8 tensors, as produced
+        by tensor loaders such as :func:`fast_image_loader`.
+        """
+
+        if isinstance(img, Tensor):
+            if not self.return_tensor:
+                raise ValueError(
+                    "The loader returned a tensor while return_tensor is "
+                    "False: when combining the decoded-image cache with a "
+                    "tensor loader (such as fast_image_loader), pass "
+                    "return_tensor=True so that cache hits return tensors "
+                    "as well."
+                )
+            arr = img.permute(1, 2, 0).numpy()
+        else:
+            arr = np.asarray(img, dtype=np.uint8)
+        if arr.shape != self._cache_shape[1:]:
+            raise ValueError(
+                "Cannot cache an image of shape {}: when the decoded-image "
+                "cache is enabled, all images must be RGB and share the "
+                "size given in cache_image_size {}.".format(
+                    arr.shape, self._cache_shape[1:3]
+                )
+            )
+        self._cache[index] = arr
+        self._cache_valid[index] = 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The bound __getitem__ implementation is re-selected on unpickling.
+        state.pop("_getitem_impl", None)
+        # Threads cannot cross process boundaries: each worker lazily
+        # starts its own read-ahead thread.
+        state["_readahead_pool"] = None
+        state["_readahead_pid"] = None
+        state["_readahead_pending"] = 0
+        if self.cache_mode is not None:
+            # The cache buffers themselves are never pickled: workers
+            # re-attach to the backing files ("mmap") or restart with a
+            # cold per-process cache ("memory").
+            state["_cache"] = None
+            state["_cache_valid"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._select_getitem_impl()
+
+    def __del__(self):
+        pool = getattr(self, "_readahead_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if getattr(self, "_cache_files", None) is None:
+            return
+        if self._cache_creator_pid != os.getpid():
+            # Only the process that created the backing files removes them.
+            return
+        for cache_file in self._cache_files:
+            try:
+                os.unlink(cache_file)
+            except OSError:
+                pass
+
+    @property
+    def imgs(self) -> List:
+        """
+        The dataset content as a list of (path, target[, bbox]) tuples.
+
+        Provided for backward compatibility: internally, paths and targets
+        are stored as separate arrays.
+        """
+
+        targets = self.targets
+        if isinstance(targets, (np.ndarray, Tensor)):
+            targets = targets.tolist()
+        paths = [self._make_path(idx) for idx in range(len(self._names))]
+
+        if self._bboxes is None:
+            return list(zip(paths, targets))
+
+        result = []
+        for path, target, bbox in zip(paths, targets, self._bboxes):
+            if bbox is None:
+                result.append((path, target))
+            else:
+                result.append((path, target, bbox))
+        return result
 
     def __getitem__(self, index):
         """
@@ -123,24 +842,64 @@ class PathsDataset(data.Dataset[Tuple[T, TTargetsType]], Generic[T, TTargetsType
         :return: loaded item.
         """
 
-        img_description = self.imgs[index]
-        impath = img_description[0]
-        target = img_description[1]
-        bbox = None
-        if len(img_description) > 2:
-            bbox = img_description[2]
+        return self._getitem_impl(index)
 
-        if self.root is not None:
-            impath = self.root / impath
-        img = self.loader(impath)
+    def _getitem_simple(self, index):
+        """
+        Fast path for the common fixed configuration: no transformations,
+        no bounding boxes and no decoded-image cache.
+        """
+
+        target = self.targets[index]
+        if isinstance(target, Tensor):
+            target = target.item()
+        img = self.loader(self._dir_prefixes[self._dir_ids[index]] + self._names[index])
+        return img, target
+
+    def _getitem_general(self, index):
+        """
+        General __getitem__ implementation, covering bounding boxes,
+        transformations and the decoded-image cache.
+        """
 
-        # If a bounding box is provided, crop the image before passing it to
-        # any user-defined transformation.
-        if bbox is not None:
-            if isinstance(bbox, Tensor):
-                bbox = bbox.tolist()
-            # crop accepts PIL images, too
-            img = crop(img, *bbox)  # type: ignore
+        impath = self._dir_prefixes[self._dir_ids[index]] + self._names[index]
+        target = self.targets[index]
+        if isinstance(target, Tensor):
+            target = target.item()
+        bbox = None if self._bboxes is None else self._bboxes[index]
+
+        img = None
+        if self.cache_mode is not None:
+            if self._cache is None:
+                self._init_cache()
+            if self._cache_valid[index]:
+                # Cache hit: the stored array is already cropped.
+                if self.return_tensor:
+                    img = self._cache_tensor(index)
+                else:
+                    img = Image.fromarray(np.asarray(self._cache[index]))
+
+        if img is None:
+            if self.readahead:
+                # Warm the page cache for an upcoming sample while this
+                # one is being read and decoded.
+                self._submit_readahead(index)
+            img = self.loader(impath)
+
+            # If a bounding box is provided, crop the image before passing
+            # it to any user-defined transformation.
+            if bbox is not None:
+                if isinstance(bbox, Tensor):
+                    bbox = bbox.tolist()
+                # crop accepts PIL images, too
+                img = crop(img, *bbox)  # type: ignore
+
+            if self.cache_mode is not None:
+                self._cache_store(index, img)
+                if self.return_tensor and not isinstance(img, Tensor):
+                    # Keep the returned type consistent from the very
+                    # first epoch.
+                    img = self._cache_tensor(index)
 
         if self.transform is not None:
             img = self.transform(img)
@@ -156,7 +915,7 @@ class PathsDataset(data.Dataset[Tuple[T, TTargetsType]], Generic[T, TTargetsType
         :return: Total number of dataset items.
         """
 
-        return len(self.imgs)
+        return len(self._names)
 
 
 class FilelistDataset(PathsDataset[T, int]):
@@ -189,7 +948,16 @@ class FilelistDataset(PathsDataset[T, int]):
         """
 
         self.flist = str(flist)  # Manages Path objects
-        files_and_labels = flist_reader(flist)
+        files_and_labels: Union[List[Tuple[str, int]], Tuple[np.ndarray, np.ndarray]]
+        if flist_reader is default_flist_reader:
+            # Hand the arrays straight to PathsDataset, without
+            # materializing intermediate (path, label) tuples.
+            arrays = _read_flist_arrays(flist)
+            files_and_labels = (
+                arrays if arrays is not None else default_flist_reader(flist)
+            )
+        else:
+            files_and_labels = flist_reader(flist)
         super().__init__(
             root,
             files_and_labels,
@@ -216,6 +984,148 @@ def checkpoint_FilelistDataset(pickler, obj: FilelistDataset):
     )
 
 
+class PackedFileDataset(data.Dataset[Tuple[T, int]], Generic[T]):
+    """
+    A dataset that reads patterns from a single packed blob file.
+
+    Loading loose image files pays one ``open()`` syscall plus header
+    parsing per pattern, which dominates the loading time of small images
+    (especially on HDDs or networked filesystems). This dataset expects
+    all the encoded images to be concatenated in a single blob file,
+    located through an offsets index: random accesses become a seek+read
+    on one long-lived file handle, so the OS page cache and readahead stay
+    effective.
+
+    The blob file is opened lazily, once per process, on first access:
+    this makes instances safe to hand to forked or spawned PyTorch
+    DataLoader workers, even when the dataset was already accessed in the
+    parent process (each worker gets its own handle and seek offset).
+    """
+
+    def __init__(
+        self,
+        blob_path: PathALikeT,
+        offsets: Union[PathALikeT, Sequence[int], np.ndarray],
+        targets: Sequence[int],
+        transform: XTransform = None,
+        target_transform: YTransform = None,
+        loader: Callable[[bytes], T] = default_blob_image_loader,
+    ):
+        """
+        Creates a dataset from a packed blob file and an offsets index.
+
+        :param blob_path: path of the blob file storing the concatenated
+            encoded images.
+        :param offsets: the offsets index: either an array of N+1 int64
+            byte offsets (pattern i spans ``[offsets[i], offsets[i+1])``)
+            or the path of a ``.npy`` file containing it.
+        :param targets: the class label of each pattern.
+        :param transform: eventual transformation to add to the input data
+            (x).
+        :param target_transform: eventual transformation to add to the
+            targets (y).
+        :param loader: loader function to use (for the real data) given
+            the encoded bytes.
+        """
+
+        self.blob_path: str = str(blob_path)
+        if isinstance(offsets, (str, Path)):
+            offsets = np.load(offsets)
+        self.offsets: np.ndarray = np.asarray(offsets, dtype=np.int64)
+        self.targets: Tensor = torch.as_tensor(np.asarray(targets, dtype=np.int64))
+        if len(self.offsets) != len(self.targets) + 1:
+            raise ValueError(
+                "The offsets index must contain one more element than "
+                "targets (got {} offsets for {} targets).".format(
+                    len(self.offsets), len(self.targets)
+                )
+            )
+        self.transform = transform
+        self.target_transform = target_transform
+        self.loader = loader
+        # The blob file handle: opened lazily (and per-process) on first
+        # access so that it is never shared across DataLoader workers.
+        self._blob_file = None
+        self._blob_pid: Optional[int] = None
+
+    def __getitem__(self, index):
+        """
+        Returns next element in the dataset given the current index.
+
+        :param index: index of the data to get.
+        :return: loaded item.
+        """
+
+        if self._blob_file is None or self._blob_pid != os.getpid():
+            # A handle inherited through fork would share one file
+            # description (and seek offset) with the parent and its
+            # siblings, so each process opens its own.
+            self._blob_file = open(self.blob_path, "rb")
+            self._blob_pid = os.getpid()
+
+        start = int(self.offsets[index])
+        end = int(self.offsets[index + 1])
+        self._blob_file.seek(start)
+        buf = self._blob_file.read(end - start)
+
+        img = self.loader(buf)
+        target = int(self.targets[index])
+
+        if self.transform is not None:
+            img = self.transform(img)
+        if self.target_transform is not None:
+            target = self.target_transform(target)
+
+        return img, target
+
+    def __len__(self):
+        """
+        Returns the total number of elements in the dataset.
+
+        :return: Total number of dataset items.
+        """
+
+        return len(self.targets)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # File handles cannot be pickled: each worker re-opens the blob.
+        state["_blob_file"] = None
+        state["_blob_pid"] = None
+        return state
+
+    def __del__(self):
+        blob_file = getattr(self, "_blob_file", None)
+        if blob_file is not None:
+            blob_file.close()
+
+
+def _wrap_experience_datasets(datasets, transform_groups, initial_transform_group):
+    """
+    Wraps the given per-experience datasets into classification datasets
+    sharing the same transform groups.
+
+    :param datasets: the per-experience datasets.
+    :param transform_groups: the transform groups definition.
+    :param initial_transform_group: the name of the initial transform
+        group ("train" or "eval").
+
+    :returns: the wrapped datasets, one per experience.
+    """
+
+    # import here to prevent circular import issue
+    from .classification_dataset import _make_taskaware_classification_dataset
+
+    return [
+        _make_taskaware_classification_dataset(
+            dataset,
+            transform_groups=transform_groups,
+            initial_transform_group=initial_transform_group,
+        )
+        for dataset in datasets
+    ]
+
+
 def datasets_from_filelists(
     root,
     train_filelists,
@@ -266,17 +1176,14 @@ def datasets_from_filelists(
     """
 
     if complete_test_set_only:
-        if not (isinstance(test_filelists, str) or isinstance(test_filelists, Path)):
-            if len(test_filelists) > 1:
-                raise ValueError(
-                    "When complete_test_set_only is True, test_filelists must "
-                    "be a str, Path or a list with a single element describing "
-                    "the path to the complete test set."
-                )
-            else:
-                test_filelists = test_filelists[0]
-        else:
+        if isinstance(test_filelists, (str, Path)):
             test_filelists = [test_filelists]
+        elif len(test_filelists) > 1:
+            raise ValueError(
+                "When complete_test_set_only is True, test_filelists must "
+                "be a str, Path or a list with a single element describing "
+                "the path to the complete test set."
+            )
     else:
         if len(test_filelists) != len(train_filelists):
             raise ValueError(
@@ -289,25 +1196,23 @@ def datasets_from_filelists(
         eval=(test_transform, test_target_transform),
     )
 
-    # import here to prevent circular import issue
-    from .utils import as_taskaware_classification_dataset
-
-    train_inc_datasets = [
-        as_taskaware_classification_dataset(
-            FilelistDataset(root, tr_flist),
-            transform_groups=transform_groups,
-            initial_transform_group="train",
+    # Each FilelistDataset independently reads and parses its own
+    # filelist; that work is I/O-bound and GIL-releasing (pandas), so the
+    # datasets of all experiences are built concurrently.
+    with ThreadPoolExecutor() as pool:
+        train_datasets = list(
+            pool.map(lambda flist: FilelistDataset(root, flist), train_filelists)
         )
-        for tr_flist in train_filelists
-    ]
-    test_inc_datasets = [
-        as_taskaware_classification_dataset(
-            FilelistDataset(root, te_flist),
-            transform_groups=transform_groups,
-            initial_transform_group="eval",
+        test_datasets = list(
+            pool.map(lambda flist: FilelistDataset(root, flist), test_filelists)
         )
-        for te_flist in test_filelists
-    ]
+
+    train_inc_datasets = _wrap_experience_datasets(
+        train_datasets, transform_groups, "train"
+    )
+    test_inc_datasets = _wrap_experience_datasets(
+        test_datasets, transform_groups, "eval"
+    )
 
     return train_inc_datasets, test_inc_datasets
 
@@ -333,8 +1238,9 @@ def datasets_from_paths(
     filelists while this one is able to create the datasets from an in-memory
     list.
 
-    Note: this utility may try to detect (and strip) the common root path of
-    all patterns in order to save some RAM memory.
+    Note: the created datasets automatically deduplicate the directory
+    prefixes of the given patterns, so passing full (absolute) paths does
+    not blow up the RAM usage.
 
     :param train_list: list of lists. Each list must contain tuples of two
         elements: the full path to the pattern and its class label. Optionally,
@@ -370,8 +1276,7 @@ def datasets_from_paths(
                     "be a single list of tuples or a nested list containing "
                     "a single lis of tuples"
                 )
-            else:
-                test_list = test_list[0]
+            # Already in the nested [[Tuple1, Tuple2, ...]] form.
         else:
             test_list = [test_list]
     else:
@@ -386,85 +1291,18 @@ def datasets_from_paths(
         eval=(test_transform, test_target_transform),
     )
 
-    common_root = None
-
-    # Detect common root
-    try:
-        all_paths = [
-            pattern_tuple[0] for exp_list in train_list for pattern_tuple in exp_list
-        ] + [pattern_tuple[0] for exp_list in test_list for pattern_tuple in exp_list]
-
-        common_root = os.path.commonpath(all_paths)
-    except ValueError:
-        # commonpath may throw a ValueError in different situations!
-        # See the official documentation for more details
-        pass
-
-    if common_root is not None and len(common_root) > 0 and common_root != "/":
-        has_common_root = True
-        common_root = str(common_root)
-    else:
-        has_common_root = False
-        common_root = None
-
-    if has_common_root:
-        # print(f'Common root found: {common_root}!')
-        # All paths have a common filesystem root
-        # Remove it from all paths!
-        single_path_case = False
-        tr_list = list()
-        te_list = list()
-
-        for idx_exp_list in range(len(train_list)):
-            if single_path_case:
-                break
-            st_list = list()
-            for x in train_list[idx_exp_list]:
-                rel = os.path.relpath(x[0], common_root)
-                if len(rel) == 0 or rel == ".":
-                    # May happen if the dataset has a single path
-                    single_path_case = True
-                    break
-                st_list.append((rel, *x[1:]))
-            tr_list.append(st_list)
-
-        for idx_exp_list in range(len(test_list)):
-            if single_path_case:
-                break
-            st_list = list()
-            for x in test_list[idx_exp_list]:
-                rel = os.path.relpath(x[0], common_root)
-                if len(rel) == 0 or rel == ".":
-                    # May happen if the dataset has a single path
-                    single_path_case = True
-                    break
-                st_list.append((rel, *x[1:]))
-            te_list.append(st_list)
-        if not single_path_case:
-            train_list = tr_list
-            test_list = te_list
-        else:
-            has_common_root = False
-            common_root = None
-
-    from avalanche.benchmarks.utils import as_taskaware_classification_dataset
+    # No common-root detection/stripping is needed here: PathsDataset
+    # interns the directory prefixes, so shared roots are stored only once
+    # whether they are stripped from the paths or not. This also avoids
+    # rebuilding every (path, label) tuple. The per-experience datasets
+    # share a single pair of concatenated backing arrays where possible.
 
-    train_inc_datasets = [
-        as_taskaware_classification_dataset(
-            PathsDataset(common_root, tr_flist),
-            transform_groups=transform_groups,
-            initial_transform_group="train",
-        )
-        for tr_flist in train_list
-    ]
-    test_inc_datasets = [
-        as_taskaware_classification_dataset(
-            PathsDataset(common_root, te_flist),
-            transform_groups=transform_groups,
-            initial_transform_group="eval",
-        )
-        for te_flist in test_list
-    ]
+    train_inc_datasets = _wrap_experience_datasets(
+        _paths_datasets_with_shared_arrays(train_list), transform_groups, "train"
+    )
+    test_inc_datasets = _wrap_experience_datasets(
+        _paths_datasets_with_shared_arrays(test_list), transform_groups, "eval"
+    )
 
     return train_inc_datasets, test_inc_datasets
 
@@ -472,50 +1310,19 @@ def datasets_from_paths(
 def common_paths_root(
     exp_list: Sequence[FilesDefT],
 ) -> Tuple[Union[str, None], Sequence[FilesDefT]]:
-    common_root = None
-
-    # Detect common root
-    try:
-        all_paths = [pattern_tuple[0] for pattern_tuple in exp_list]
-
-        common_root = os.path.commonpath(all_paths)
-    except ValueError:
-        # commonpath may throw a ValueError in different situations!
-        # See the official documentation for more details
-        pass
-
-    if common_root is not None and len(common_root) > 0 and common_root != "/":
-        has_common_root = True
-        common_root = str(common_root)
-    else:
-        has_common_root = False
-        common_root = None
+    common_root = _detect_common_root([exp_list])
 
     exp_list_result: Sequence[FilesDefT]
 
-    if has_common_root:
-        # print(f'Common root found: {common_root}!')
-        # All paths have a common filesystem root
-        # Remove it from all paths!
-        single_path_case = False
-        exp_tuples: List[FilesDefT] = list()
-
-        for x in exp_list:
-            if single_path_case:
-                break
-
-            rel = os.path.relpath(x[0], common_root)
-            if len(rel) == 0 or rel == ".":
-                # May happen if the dataset has a single path
-                single_path_case = True
-                break
-            exp_tuples.append((rel, *x[1:]))  # type: ignore
-
-        if not single_path_case:
-            exp_list_result = exp_tuples
-        else:
-            exp_list_result = exp_list
-            common_root = None
+    if common_root is not None:
+        # All paths have a common filesystem root: remove it from all
+        # paths. _detect_common_root guarantees that every path starts
+        # with common_root followed by a separator, so the prefix can be
+        # removed with a plain slice instead of os.path.relpath.
+        cut = len(common_root) + 1
+        exp_list_result = [
+            (os.fspath(x[0])[cut:], *x[1:]) for x in exp_list  # type: ignore
+        ]
     else:
         exp_list_result = exp_list
 
@@ -524,9 +1331,12 @@ def common_paths_root(
 
 __all__ = [
     "default_image_loader",
+    "default_blob_image_loader",
+    "fast_image_loader",
     "default_flist_reader",
     "PathsDataset",
     "FilelistDataset",
+    "PackedFileDataset",
     "datasets_from_filelists",
     "datasets_from_paths",
     "common_paths_root",
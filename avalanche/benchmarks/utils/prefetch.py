@@ -0,0 +1,155 @@
+################################################################################
+# Copyright (c) 2021 ContinualAI.                                              #
+# Copyrights licensed under the MIT License.                                   #
+# See the accompanying LICENSE file for terms.                                 #
+#                                                                              #
+# Date: 01-09-2026                                                             #
+# E-mail: contact@continualai.org                                              #
+# Website: avalanche.continualai.org                                           #
+################################################################################
+
+"""This module contains a small helper to overlap host-to-device batch
+copies with computation when training on CUDA devices."""
+
+from typing import Optional, Sequence, Union
+
+import torch
+from torch import Tensor
+
+
+class CudaPrefetchLoader:
+    """
+    Wraps a :class:`~torch.utils.data.DataLoader` so that each batch is
+    moved to a CUDA device on a side stream while the previous batch is
+    being consumed.
+
+    With a plain loader, the host-to-device copy of a batch happens
+    synchronously at the beginning of each training step. This wrapper
+    issues the copy of batch ``i+1`` on a dedicated CUDA stream while the
+    forward/backward of batch ``i`` runs, hiding the PCIe transfer (and
+    the optional normalization) behind compute.
+
+    For the copies to be truly asynchronous, the wrapped loader should be
+    created with ``pin_memory=True``.
+
+    Example::
+
+        train_loader = DataLoader(dataset, batch_size=128, pin_memory=True)
+        for x, y, *_ in CudaPrefetchLoader(train_loader, device="cuda"):
+            ...  # x and y are already on the device
+
+    When the target device is not a CUDA device, the wrapper degrades to
+    a plain synchronous passthrough (batches are still moved to the
+    requested device). When a CUDA device is requested but CUDA is not
+    available, batches are passed through unmoved, on their original
+    device.
+    """
+
+    def __init__(
+        self,
+        loader,
+        device: Optional[Union[str, torch.device]] = None,
+        mean: Optional[Sequence[float]] = None,
+        std: Optional[Sequence[float]] = None,
+    ):
+        """
+        Creates a prefetching wrapper around the given loader.
+
+        :param loader: the data loader (or any iterable of batches) to
+            wrap. Batches may be tensors or tuples/lists/dicts of tensors;
+            non-tensor elements are passed through unchanged.
+        :param device: the target device. Defaults to "cuda".
+        :param mean: optional per-channel mean. When given (together with
+            ``std``), the first element of each batch is converted to
+            float and normalized on the side stream as part of the
+            prefetch.
+        :param std: optional per-channel standard deviation.
+        """
+
+        self.loader = loader
+        self.device = torch.device(device if device is not None else "cuda")
+        self.mean: Optional[Tensor] = None
+        self.std: Optional[Tensor] = None
+        if (mean is None) != (std is None):
+            raise ValueError("mean and std must be given (or omitted) together.")
+        if mean is not None:
+            self.mean = torch.as_tensor(mean, dtype=torch.float32).view(1, -1, 1, 1)
+            self.std = torch.as_tensor(std, dtype=torch.float32).view(1, -1, 1, 1)
+
+    def __len__(self):
+        return len(self.loader)
+
+    def _to_device(self, batch, non_blocking: bool):
+        if isinstance(batch, Tensor):
+            return batch.to(self.device, non_blocking=non_blocking)
+        if isinstance(batch, (tuple, list)):
+            return type(batch)(self._to_device(el, non_blocking) for el in batch)
+        if isinstance(batch, dict):
+            return {k: self._to_device(v, non_blocking) for k, v in batch.items()}
+        return batch
+
+    def _normalize(self, batch):
+        if self.mean is None or not isinstance(batch, (tuple, list)):
+            return batch
+        x = batch[0]
+        if isinstance(x, Tensor):
+            # Out-of-place: float() is a no-op on float32 input, so an
+            # in-place sub_/div_ would corrupt the caller's batch on the
+            # non-CUDA paths (and re-normalize it on a second iteration).
+            x = (x.float() - self.mean) / self.std
+            batch = type(batch)((x, *batch[1:]))
+        return batch
+
+    @staticmethod
+    def _record_stream(batch, stream):
+        if isinstance(batch, Tensor):
+            if batch.is_cuda:
+                batch.record_stream(stream)
+        elif isinstance(batch, (tuple, list)):
+            for el in batch:
+                CudaPrefetchLoader._record_stream(el, stream)
+        elif isinstance(batch, dict):
+            for el in batch.values():
+                CudaPrefetchLoader._record_stream(el, stream)
+
+    def __iter__(self):
+        if self.device.type != "cuda" or not torch.cuda.is_available():
+            # No side stream available: plain synchronous passthrough. A
+            # CUDA device that does not exist cannot be copied to, so in
+            # that case batches are left on their original device.
+            move = self.device.type != "cuda"
+            for batch in self.loader:
+                if move:
+                    batch = self._to_device(batch, False)
+                yield self._normalize(batch)
+            return
+
+        if self.mean is not None:
+            self.mean = self.mean.to(self.device)
+            self.std = self.std.to(self.device)
+
+        side_stream = torch.cuda.Stream(device=self.device)
+        current_stream = torch.cuda.current_stream(self.device)
+        ready_batch = None
+
+        for batch in self.loader:
+            # Copy (and normalize) the incoming batch on the side stream
+            # while the consumer is still working on the previous one.
+            with torch.cuda.stream(side_stream):
+                batch = self._normalize(self._to_device(batch, True))
+
+            if ready_batch is not None:
+                yield ready_batch
+
+            # The consumer stream must not touch the new batch before its
+            # copy is complete, and the caching allocator must not reuse
+            # its memory while the consumer stream still reads it.
+            current_stream.wait_stream(side_stream)
+            self._record_stream(batch, current_stream)
+            ready_batch = batch
+
+        if ready_batch is not None:
+            yield ready_batch
+
+
+__all__ = ["CudaPrefetchLoader"]
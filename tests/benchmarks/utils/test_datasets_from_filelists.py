@@ -0,0 +1,354 @@
+import io
+import multiprocessing
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+from PIL import Image
+
+from avalanche.benchmarks.utils import (
+    PackedFileDataset,
+    PathsDataset,
+    datasets_from_filelists,
+    datasets_from_paths,
+    fast_image_loader,
+)
+
+
+class DatasetsFromPathsTests(unittest.TestCase):
+    def _make_images(self, dirpath, n_images):
+        paths = []
+        for img_idx in range(n_images):
+            img_path = os.path.join(dirpath, "img_{}.png".format(img_idx))
+            Image.new("RGB", (8, 8), color=(img_idx, 0, 0)).save(img_path)
+            paths.append(img_path)
+        return paths
+
+    def test_complete_test_set_only_nested_list(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            paths = self._make_images(tmpdirname, 4)
+            train_list = [
+                [(paths[0], 0), (paths[1], 1)],
+                [(paths[2], 0), (paths[3], 1)],
+            ]
+            test_list = [[(paths[0], 0), (paths[1], 1)]]
+
+            train_datasets, test_datasets = datasets_from_paths(
+                train_list, test_list, complete_test_set_only=True
+            )
+
+            self.assertEqual(2, len(train_datasets))
+            self.assertEqual(1, len(test_datasets))
+            self.assertEqual(2, len(test_datasets[0]))
+
+            pattern = test_datasets[0][1]
+            self.assertEqual(1, int(pattern[1]))
+
+    def test_complete_test_set_only_flat_list(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            paths = self._make_images(tmpdirname, 4)
+            train_list = [
+                [(paths[0], 0), (paths[1], 1)],
+                [(paths[2], 0), (paths[3], 1)],
+            ]
+            test_list = [(paths[0], 0), (paths[1], 1)]
+
+            train_datasets, test_datasets = datasets_from_paths(
+                train_list, test_list, complete_test_set_only=True
+            )
+
+            self.assertEqual(2, len(train_datasets))
+            self.assertEqual(1, len(test_datasets))
+            self.assertEqual(2, len(test_datasets[0]))
+
+    def test_complete_test_set_only_multiple_lists_error(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            paths = self._make_images(tmpdirname, 4)
+            train_list = [
+                [(paths[0], 0), (paths[1], 1)],
+                [(paths[2], 0), (paths[3], 1)],
+            ]
+            test_list = [
+                [(paths[0], 0)],
+                [(paths[1], 1)],
+            ]
+
+            with self.assertRaises(ValueError):
+                datasets_from_paths(train_list, test_list, complete_test_set_only=True)
+
+    def test_mismatched_number_of_experiences_error(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            paths = self._make_images(tmpdirname, 4)
+            train_list = [
+                [(paths[0], 0), (paths[1], 1)],
+                [(paths[2], 0), (paths[3], 1)],
+            ]
+            test_list = [[(paths[0], 0)]]
+
+            with self.assertRaises(ValueError):
+                datasets_from_paths(train_list, test_list, complete_test_set_only=False)
+
+
+class PathsDatasetCacheTests(unittest.TestCase):
+    def _make_images(self, dirpath, n_images):
+        files = []
+        for img_idx in range(n_images):
+            img_path = os.path.join(dirpath, "img_{}.png".format(img_idx))
+            Image.new("RGB", (8, 8), color=(img_idx, 0, 0)).save(img_path)
+            files.append((img_path, img_idx))
+        return files
+
+    def test_memory_cache_hit_returns_identical_data(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = self._make_images(tmpdirname, 3)
+            dataset = PathsDataset(
+                None, files, cache_mode="memory", cache_image_size=(8, 8)
+            )
+
+            first_epoch = [dataset[idx] for idx in range(len(dataset))]
+            self.assertTrue(all(dataset._cache_valid))
+            second_epoch = [dataset[idx] for idx in range(len(dataset))]
+
+            for (img_a, target_a), (img_b, target_b) in zip(first_epoch, second_epoch):
+                self.assertEqual(target_a, target_b)
+                self.assertTrue(np.array_equal(np.asarray(img_a), np.asarray(img_b)))
+
+    def test_memory_cache_return_tensor(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = self._make_images(tmpdirname, 2)
+            dataset = PathsDataset(
+                None,
+                files,
+                cache_mode="memory",
+                cache_image_size=(8, 8),
+                return_tensor=True,
+            )
+
+            img_miss, _ = dataset[1]
+            img_hit, _ = dataset[1]
+            self.assertIsInstance(img_miss, torch.Tensor)
+            self.assertEqual((3, 8, 8), tuple(img_hit.shape))
+            self.assertTrue(torch.equal(img_miss, img_hit))
+
+    def test_cache_with_tensor_loader(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = self._make_images(tmpdirname, 2)
+            dataset = PathsDataset(
+                None,
+                files,
+                loader=fast_image_loader,
+                cache_mode="memory",
+                cache_image_size=(8, 8),
+                return_tensor=True,
+            )
+
+            img_miss, _ = dataset[0]
+            img_hit, _ = dataset[0]
+            self.assertTrue(dataset._cache_valid[0])
+            self.assertTrue(torch.equal(img_miss, img_hit))
+
+    def test_cache_with_tensor_loader_requires_return_tensor(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = self._make_images(tmpdirname, 1)
+            dataset = PathsDataset(
+                None,
+                files,
+                loader=fast_image_loader,
+                cache_mode="memory",
+                cache_image_size=(8, 8),
+            )
+
+            with self.assertRaises(ValueError):
+                dataset[0]
+
+    def test_mmap_cache_reattach_after_pickling(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = self._make_images(tmpdirname, 2)
+            dataset = PathsDataset(
+                None, files, cache_mode="mmap", cache_image_size=(8, 8)
+            )
+            img_orig, _ = dataset[0]
+
+            clone = pickle.loads(pickle.dumps(dataset))
+            # The clone re-attaches to the same backing files, so the
+            # entry cached above is already valid.
+            img_clone, target_clone = clone[0]
+            self.assertTrue(clone._cache_valid[0])
+            self.assertEqual(0, target_clone)
+            self.assertTrue(np.array_equal(np.asarray(img_orig), np.asarray(img_clone)))
+
+    @unittest.skipIf(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        "requires the fork start method",
+    )
+    def test_readahead_pool_rebuilt_in_forked_worker(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = self._make_images(tmpdirname, 4)
+            dataset = PathsDataset(None, files, readahead=1)
+            dataset[0]  # Create the read-ahead pool in the parent, pre-fork.
+            self.assertIsNotNone(dataset._readahead_pool)
+
+            def _read_all():
+                # The inherited pool has no worker thread in this process:
+                # it must be replaced on first use, not reused.
+                for idx in range(len(dataset)):
+                    img, target = dataset[idx]
+                    assert idx == target
+                assert dataset._readahead_pid == os.getpid()
+                dataset._readahead_pool.shutdown(wait=True)
+                assert dataset._readahead_pending == 0
+
+            process = multiprocessing.get_context("fork").Process(target=_read_all)
+            process.start()
+            process.join()
+            self.assertEqual(0, process.exitcode)
+
+    def test_readahead_returns_same_data(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = self._make_images(tmpdirname, 4)
+            plain = PathsDataset(None, files)
+            with_readahead = PathsDataset(None, files, readahead=2)
+
+            for idx in range(len(plain)):
+                img_a, target_a = plain[idx]
+                img_b, target_b = with_readahead[idx]
+                self.assertEqual(target_a, target_b)
+                self.assertTrue(np.array_equal(np.asarray(img_a), np.asarray(img_b)))
+
+
+class PackedFileDatasetTests(unittest.TestCase):
+    def _make_blob(self, dirpath, n_images):
+        blob_path = os.path.join(dirpath, "patterns.bin")
+        offsets = [0]
+        images = []
+        with open(blob_path, "wb") as blob_file:
+            for img_idx in range(n_images):
+                img = Image.new("RGB", (8, 8), color=(img_idx, 0, 0))
+                images.append(img)
+                buf = io.BytesIO()
+                img.save(buf, format="PNG")
+                blob_file.write(buf.getvalue())
+                offsets.append(offsets[-1] + len(buf.getvalue()))
+        return blob_path, np.asarray(offsets, dtype=np.int64), images
+
+    def test_offsets_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            blob_path, offsets, images = self._make_blob(tmpdirname, 3)
+            targets = [0, 1, 2]
+            dataset = PackedFileDataset(blob_path, offsets, targets)
+
+            self.assertEqual(3, len(dataset))
+            for idx, expected in enumerate(images):
+                img, target = dataset[idx]
+                self.assertEqual(idx, target)
+                self.assertTrue(np.array_equal(np.asarray(expected), np.asarray(img)))
+
+    def test_offsets_from_npy_file(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            blob_path, offsets, images = self._make_blob(tmpdirname, 2)
+            offsets_path = os.path.join(tmpdirname, "offsets.npy")
+            np.save(offsets_path, offsets)
+            dataset = PackedFileDataset(blob_path, offsets_path, [0, 1])
+
+            img, target = dataset[1]
+            self.assertEqual(1, target)
+            self.assertTrue(np.array_equal(np.asarray(images[1]), np.asarray(img)))
+
+    def test_pickled_dataset_reopens_blob(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            blob_path, offsets, images = self._make_blob(tmpdirname, 2)
+            dataset = PackedFileDataset(blob_path, offsets, [0, 1])
+            dataset[0]  # Force the lazy handle open.
+
+            clone = pickle.loads(pickle.dumps(dataset))
+            img, target = clone[1]
+            self.assertEqual(1, target)
+            self.assertTrue(np.array_equal(np.asarray(images[1]), np.asarray(img)))
+
+    @unittest.skipIf(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        "requires the fork start method",
+    )
+    def test_forked_reader_reopens_blob(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            blob_path, offsets, images = self._make_blob(tmpdirname, 3)
+            dataset = PackedFileDataset(blob_path, offsets, [0, 1, 2])
+            dataset[0]  # Open the handle in the parent, pre-fork.
+
+            def _read_all():
+                # A handle inherited through fork must not be reused: it
+                # would share its seek offset with the parent.
+                for idx, expected in enumerate(images):
+                    img, target = dataset[idx]
+                    assert idx == target
+                    assert np.array_equal(np.asarray(expected), np.asarray(img))
+                assert dataset._blob_pid == os.getpid()
+
+            process = multiprocessing.get_context("fork").Process(target=_read_all)
+            process.start()
+            process.join()
+            self.assertEqual(0, process.exitcode)
+
+    def test_mismatched_offsets_error(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            blob_path, offsets, _ = self._make_blob(tmpdirname, 2)
+            with self.assertRaises(ValueError):
+                PackedFileDataset(blob_path, offsets, [0, 1, 2])
+
+
+class DatasetsFromFilelistsTests(unittest.TestCase):
+    def _make_filelists(self, dirpath, n_experiences, n_images_each):
+        filelists = []
+        img_idx = 0
+        for exp_idx in range(n_experiences):
+            flist_path = os.path.join(dirpath, "exp_{}.txt".format(exp_idx))
+            with open(flist_path, "w") as flist_file:
+                for label in range(n_images_each):
+                    img_name = "img_{}.png".format(img_idx)
+                    Image.new("RGB", (8, 8), color=(img_idx, 0, 0)).save(
+                        os.path.join(dirpath, img_name)
+                    )
+                    flist_file.write("{} {}\n".format(img_name, label))
+                    img_idx += 1
+            filelists.append(flist_path)
+        return filelists
+
+    def test_two_experiences(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            train_filelists = self._make_filelists(tmpdirname, 2, 2)
+            test_filelists = self._make_filelists(tmpdirname, 2, 2)
+
+            train_datasets, test_datasets = datasets_from_filelists(
+                tmpdirname, train_filelists, test_filelists
+            )
+
+            self.assertEqual(2, len(train_datasets))
+            self.assertEqual(2, len(test_datasets))
+            for dataset in train_datasets + test_datasets:
+                self.assertEqual(2, len(dataset))
+
+            pattern = train_datasets[0][1]
+            self.assertEqual(1, int(pattern[1]))
+
+    def test_complete_test_set_only_single_path(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            train_filelists = self._make_filelists(tmpdirname, 2, 2)
+            test_filelist = self._make_filelists(tmpdirname, 1, 2)[0]
+
+            train_datasets, test_datasets = datasets_from_filelists(
+                tmpdirname,
+                train_filelists,
+                test_filelist,
+                complete_test_set_only=True,
+            )
+
+            self.assertEqual(2, len(train_datasets))
+            self.assertEqual(1, len(test_datasets))
+            self.assertEqual(2, len(test_datasets[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+import torch
+
+from avalanche.benchmarks.utils import CudaPrefetchLoader
+
+
+class CudaPrefetchLoaderTests(unittest.TestCase):
+    def _make_batches(self, n_batches=3):
+        return [
+            (
+                torch.full((2, 3, 4, 4), batch_idx, dtype=torch.uint8),
+                torch.tensor([batch_idx, batch_idx]),
+            )
+            for batch_idx in range(n_batches)
+        ]
+
+    def test_cpu_passthrough(self):
+        batches = self._make_batches()
+        wrapped = CudaPrefetchLoader(batches, device="cpu")
+
+        self.assertEqual(len(batches), len(wrapped))
+        for (x, y), (exp_x, exp_y) in zip(wrapped, batches):
+            self.assertTrue(torch.equal(x, exp_x))
+            self.assertTrue(torch.equal(y, exp_y))
+
+    def test_cpu_normalization(self):
+        batches = self._make_batches()
+        wrapped = CudaPrefetchLoader(
+            batches, device="cpu", mean=[1.0, 2.0, 3.0], std=[2.0, 2.0, 2.0]
+        )
+
+        mean = torch.tensor([1.0, 2.0, 3.0]).view(1, -1, 1, 1)
+        std = torch.tensor([2.0, 2.0, 2.0]).view(1, -1, 1, 1)
+        for (x, y), (exp_x, exp_y) in zip(wrapped, batches):
+            self.assertEqual(torch.float32, x.dtype)
+            self.assertTrue(torch.equal(x, (exp_x.float() - mean) / std))
+            self.assertTrue(torch.equal(y, exp_y))
+
+    def test_cpu_normalization_float_input_not_mutated(self):
+        batches = [
+            (torch.full((2, 3, 4, 4), 1.0), torch.tensor([0, 0])),
+            (torch.full((2, 3, 4, 4), 2.0), torch.tensor([1, 1])),
+        ]
+        wrapped = CudaPrefetchLoader(
+            batches, device="cpu", mean=[0.5, 0.5, 0.5], std=[2.0, 2.0, 2.0]
+        )
+
+        first_pass = [x.clone() for x, _ in wrapped]
+        # The source batches must be untouched, so a second iteration
+        # yields the same (not doubly-normalized) values.
+        self.assertTrue(torch.equal(torch.full((2, 3, 4, 4), 1.0), batches[0][0]))
+        second_pass = [x.clone() for x, _ in wrapped]
+        for x_a, x_b in zip(first_pass, second_pass):
+            self.assertTrue(torch.equal(x_a, x_b))
+        self.assertTrue(torch.equal(torch.full((2, 3, 4, 4), 0.25), first_pass[0]))
+
+    @unittest.skipIf(torch.cuda.is_available(), "requires a CUDA-less host")
+    def test_cuda_unavailable_passthrough(self):
+        batches = self._make_batches()
+        wrapped = CudaPrefetchLoader(batches, device="cuda")
+
+        for (x, y), (exp_x, exp_y) in zip(wrapped, batches):
+            self.assertEqual("cpu", x.device.type)
+            self.assertTrue(torch.equal(x, exp_x))
+            self.assertTrue(torch.equal(y, exp_y))
+
+    def test_mean_without_std_error(self):
+        with self.assertRaises(ValueError):
+            CudaPrefetchLoader([], device="cpu", mean=[0.5, 0.5, 0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()